@@ -1,66 +1,82 @@
 import asyncio
-import json
+import logging
 import os
 
-from agent.clients.custom_mcp_client import CustomMCPClient
+from agent.clients.custom_mcp_client import CustomMCPClient, create_http_session
 from agent.clients.mcp_client import MCPClient
 from agent.clients.dial_client import DialClient
 from agent.models.message import Message, Role
 
 
-async def _collect_tools(
+def _collect_tools(
         client: MCPClient | CustomMCPClient,
+        client_tools: list[dict],
         tools: list[dict],
         tool_name_client_map: dict[str, MCPClient | CustomMCPClient]
 ):
-    for tool in await client.get_tools():
-        tools.append(tool)
+    tools.extend(client_tools)
+    for tool in client_tools:
         tool_name_client_map[tool.get('function', {}).get('name')] = client
-        print(f"{json.dumps(tool, indent=2)}")
 
 async def main():
     tools: list[dict] = []
     tool_name_client_map: dict[str, MCPClient | CustomMCPClient] = {}
 
-    ums_mcp_client = await MCPClient.create("http://localhost:8006/mcp")
-    await _collect_tools(ums_mcp_client, tools, tool_name_client_map)
-
-    fetch_mcp_client = await CustomMCPClient.create("https://remote.mcpservers.org/fetch/mcp")
-    await _collect_tools(fetch_mcp_client, tools, tool_name_client_map)
-
-    dial_client = DialClient(
-        api_key=os.getenv("DIAL_API_KEY"),
-        endpoint="https://ai-proxy.lab.epam.com",
-        tools=tools,
-        tool_name_client_map=tool_name_client_map
-    )
-
-    messages: list[Message] = [
-        Message(
-            role=Role.SYSTEM,
-            content="You are an advanced AI agent. Your goal is to assist user with his questions."
+    # Client lives for the whole main() and is closed once on exit
+    http_session = create_http_session()
+    try:
+        # Handshakes with independent servers are done concurrently
+        ums_mcp_client, fetch_mcp_client = await asyncio.gather(
+            MCPClient.create("http://localhost:8006/mcp"),
+            CustomMCPClient.create("https://remote.mcpservers.org/fetch/mcp", session=http_session)
         )
-    ]
+        ums_tools, fetch_tools = await asyncio.gather(ums_mcp_client.get_tools(), fetch_mcp_client.get_tools())
+        # Tools are merged in fixed order regardless of which server answers first: UMS tools go first
+        # and fetch server wins a tool name clash
+        _collect_tools(ums_mcp_client, ums_tools, tools, tool_name_client_map)
+        _collect_tools(fetch_mcp_client, fetch_tools, tools, tool_name_client_map)
 
-    print("MCP-based Agent is ready! Type your query or 'exit' to exit.")
-    while True:
-        user_input = input("\n> ").strip()
-        if user_input.lower() == 'exit':
-            break
+        dial_client = DialClient(
+            api_key=os.getenv("DIAL_API_KEY"),
+            endpoint="https://ai-proxy.lab.epam.com",
+            tools=tools,
+            tool_name_client_map=tool_name_client_map
+        )
 
-        messages.append(
+        messages: list[Message] = [
             Message(
-                role=Role.USER,
-                content=user_input
+                role=Role.SYSTEM,
+                content="You are an advanced AI agent. Your goal is to assist user with his questions."
+            )
+        ]
+
+        print("MCP-based Agent is ready! Type your query or 'exit' to exit.")
+        while True:
+            user_input = input("\n> ").strip()
+            if user_input.lower() == 'exit':
+                break
+
+            messages.append(
+                Message(
+                    role=Role.USER,
+                    content=user_input
+                )
             )
-        )
 
-        ai_message: Message = await dial_client.get_completion(messages)
-        messages.append(ai_message)
+            ai_message: Message = await dial_client.get_completion(messages)
+            messages.append(ai_message)
+    finally:
+        await http_session.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "warning").upper())
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
 
 
 # Check if Arkadiy Dobkin present as a user, if not then search info about him in the web and add him
@@ -1,101 +1,184 @@
-import json
-import uuid
-from typing import Optional, Any
-import aiohttp
+import logging
+import re
+from typing import AsyncIterator, Optional, Any
+import httpx
+import orjson
 
 
+logger = logging.getLogger(__name__)
+
 MCP_SESSION_ID_HEADER = "Mcp-Session-Id"
 
+_SSE_EVENT_BOUNDARY = re.compile(rb"\r?\n\r?\n")
+_SSE_DONE = b"[DONE]"
+
+
+class SSEDecoder:
+    """Incremental Server-Sent Events decoder working on raw bytes"""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # Buffer before this position has no event boundary, so it isn't rescanned when next chunk arrives
+        self._scan_pos = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add raw bytes and return `data` payloads of all events completed by them"""
+        self._buffer += chunk
+        payloads = []
+        start = 0
+        # Step back 3 bytes in case `\r\n\r\n` boundary is split between chunks
+        pos = max(self._scan_pos - 3, 0)
+        while match := _SSE_EVENT_BOUNDARY.search(self._buffer, pos):
+            if (data := self._decode_event(self._buffer[start:match.start()])) is not None:
+                payloads.append(data)
+            start = pos = match.end()
+        del self._buffer[:start]
+        self._scan_pos = len(self._buffer)
+        return payloads
+
+    def flush(self) -> list[bytes]:
+        """Return payload of the trailing event if stream ended without a blank line"""
+        data = self._decode_event(self._buffer)
+        self._buffer.clear()
+        self._scan_pos = 0
+        return [data] if data is not None else []
+
+    async def iter(self, response: httpx.Response) -> AsyncIterator[Any]:
+        """Yield JSON messages from SSE response until stream end or `data: [DONE]`"""
+        async for data in self._iter_payloads(response):
+            if data == _SSE_DONE:
+                return
+            try:
+                yield orjson.loads(data)
+            except orjson.JSONDecodeError:
+                continue
+
+    async def _iter_payloads(self, response: httpx.Response) -> AsyncIterator[bytes]:
+        async for chunk in response.aiter_bytes():
+            for data in self.feed(chunk):
+                yield data
+
+        for data in self.flush():
+            yield data
+
+    @staticmethod
+    def _decode_event(event: bytes | bytearray) -> Optional[bytes]:
+        """Join `data:` lines of a single event, comments and other fields are skipped"""
+        data_lines = [
+            line[5:].removeprefix(b" ").rstrip(b"\r")
+            for line in event.split(b"\n")
+            if line.startswith(b"data:")
+        ]
+        if not data_lines:
+            return None
+
+        data = b"\n".join(data_lines).strip()
+        return data or None
+
+
+def create_http_session() -> httpx.AsyncClient:
+    """Create HTTP client for MCP servers, HTTP/2 lets concurrent tool calls multiplex over a single connection"""
+    return httpx.AsyncClient(
+        http2=True,
+        # Idle connections expire before MCP server drops them (timeout_keep_alive=75), so a socket being closed
+        # by server is never reused
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60),
+        timeout=httpx.Timeout(30.0, connect=10.0)
+    )
+
+
 class CustomMCPClient:
     """Pure Python MCP client without external MCP libraries"""
 
-    def __init__(self, mcp_server_url: str) -> None:
+    _INIT_HEADERS = {
+        "Content-Type": "application/json",
+        "Accept": "application/json, text/event-stream"
+    }
+
+    def __init__(self, mcp_server_url: str, session: Optional[httpx.AsyncClient] = None) -> None:
         self.server_url = mcp_server_url
         self.session_id: Optional[str] = None
-        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.http_session: Optional[httpx.AsyncClient] = session
+        # Shared sessions are owned (and closed) by whoever passed them in
+        self._owns_http_session = session is None
+        self._next_id = 0
+        # Headers are rebuilt only when session ID changes and are reused by all other requests
+        self._headers = self._INIT_HEADERS
 
     @classmethod
-    async def create(cls, mcp_server_url: str) -> 'CustomMCPClient':
+    async def create(
+            cls,
+            mcp_server_url: str,
+            session: Optional[httpx.AsyncClient] = None
+    ) -> 'CustomMCPClient':
         """Async factory method to create and connect CustomMCPClient"""
-        instance = cls(mcp_server_url)
+        instance = cls(mcp_server_url, session=session)
         await instance.connect()
         return instance
 
-    async def _send_request(self, method: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
-        """Send JSON-RPC request to MCP server"""
-        if not self.http_session:
-            raise RuntimeError("HTTP session not initialized")
-
+    def _build_request(self, method: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """Build JSON-RPC request with next request ID"""
+        self._next_id += 1
         request_data: dict[str, Any] = {
             "jsonrpc": "2.0",
-            "id": str(uuid.uuid4()),
+            "id": self._next_id,
             "method": method
         }
 
         if params:
             request_data["params"] = params
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream"
-        }
+        return request_data
+
+    async def _send_request(self, method: str, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        """Send JSON-RPC request to MCP server"""
+        if not self.http_session:
+            raise RuntimeError("HTTP session not initialized")
+
+        # Session ID header is sent with all non-initialize requests
+        headers = self._INIT_HEADERS if method == "initialize" else self._headers
+        response_data = await self._post(self._build_request(method, params), headers)
 
-        # Add session ID header for non-initialize requests
-        if method != "initialize" and self.session_id:
-            headers[MCP_SESSION_ID_HEADER] = self.session_id
+        if "error" in response_data:
+            error = response_data["error"]
+            raise RuntimeError(f"MCP Error {error['code']}: {error['message']}")
 
-        async with self.http_session.post(
+        return response_data
+
+    async def _post(self, payload: dict[str, Any] | list[dict[str, Any]], headers: dict[str, str]) -> Any:
+        """POST JSON-RPC payload and return parsed response body (empty dict for 202 Accepted)"""
+        async with self.http_session.stream(
+                "POST",
                 self.server_url,
-                json=request_data,
+                content=orjson.dumps(payload),
                 headers=headers
         ) as response:
             if not self.session_id and response.headers.get(MCP_SESSION_ID_HEADER):
-                self.session_id = response.headers[MCP_SESSION_ID_HEADER]
+                self._set_session_id(response.headers[MCP_SESSION_ID_HEADER])
 
-            if response.status == 202:
+            if response.status_code == 202:
                 return {}
 
             # Check content type to determine parsing strategy
             content_type = response.headers.get('content-type', '').lower()
 
             if 'text/event-stream' in content_type:
-                response_data = await self._parse_sse_response_streaming(response)
-            else:
-                # Handle regular JSON response
-                response_data = await response.json()
-
-            if "error" in response_data:
-                error = response_data["error"]
-                raise RuntimeError(f"MCP Error {error['code']}: {error['message']}")
+                return await self._parse_sse_response_streaming(response)
 
-            return response_data
+            # Handle regular JSON response
+            return orjson.loads(await response.aread())
 
-    async def _parse_sse_response_streaming(self, response: aiohttp.ClientResponse) -> dict[str, Any]:
+    async def _parse_sse_response_streaming(self, response: httpx.Response) -> dict[str, Any]:
         """Parse Server-Sent Events response with streaming"""
-        async for line in response.content:
-            line_str = line.decode('utf-8').strip()
-
-            if not line_str or line_str.startswith(':'):
-                continue
-
-            if line_str.startswith('data: '):
-                data_part = line_str[6:].strip()
-
-                if data_part in ('[DONE]', ''):
-                    continue
-
-                try:
-                    return json.loads(data_part)
-                except json.JSONDecodeError:
-                    continue
+        async for message in SSEDecoder().iter(response):
+            return message
 
         raise RuntimeError("No valid JSON data found in SSE stream")
 
     async def connect(self) -> None:
         """Connect to MCP server and initialize session"""
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10)
-        self.http_session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+        if not self.http_session:
+            self.http_session = create_http_session()
 
         try:
             init_params = {
@@ -111,10 +194,16 @@ class CustomMCPClient:
 
             init_result = await self._send_request("initialize", init_params)
             await self._send_notification("notifications/initialized")
-            print(json.dumps(init_result, indent=2))
+            logger.debug("MCP server initialized: %s", init_result)
         except Exception as e:
             raise RuntimeError(f"Failed to connect to MCP server: {e}")
 
+    async def close(self) -> None:
+        """Close HTTP session if it was created by this client"""
+        if self._owns_http_session and self.http_session:
+            await self.http_session.aclose()
+        self.http_session = None
+
     async def _send_notification(self, method: str) -> None:
         """Send notification (no response expected)"""
         if not self.http_session:
@@ -125,23 +214,21 @@ class CustomMCPClient:
             "method": method
         }
 
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream"
-        }
-
-        if self.session_id:
-            headers[MCP_SESSION_ID_HEADER] = self.session_id
-
-        async with self.http_session.post(
-                self.server_url,
-                json=request_data,
-                headers=headers
-        ) as response:
-            # Extract session ID from response headers if available
-            if MCP_SESSION_ID_HEADER in response.headers:
-                self.session_id = response.headers[MCP_SESSION_ID_HEADER]
-                print(f"Session ID: {self.session_id}")
+        response = await self.http_session.post(
+            self.server_url,
+            content=orjson.dumps(request_data),
+            headers=self._headers
+        )
+        # Extract session ID from response headers if available
+        if MCP_SESSION_ID_HEADER in response.headers:
+            self._set_session_id(response.headers[MCP_SESSION_ID_HEADER])
+            logger.debug("Session ID: %s", self.session_id)
+
+    def _set_session_id(self, session_id: str) -> None:
+        """Store session ID and rebuild cached request headers"""
+        if session_id != self.session_id:
+            self.session_id = session_id
+            self._headers = {**self._INIT_HEADERS, MCP_SESSION_ID_HEADER: session_id}
 
     async def get_tools(self) -> list[dict[str, Any]]:
         """Get available tools from MCP server"""
@@ -167,7 +254,7 @@ class CustomMCPClient:
         if not self.http_session:
             raise RuntimeError("MCP client not connected. Call connect() first.")
 
-        print(f"    Calling `{tool_name}` with {tool_args}")
+        logger.debug("Calling `%s` with %s", tool_name, tool_args)
 
         params = {
             "name": tool_name,
@@ -176,10 +263,58 @@ class CustomMCPClient:
 
         response = await self._send_request("tools/call", params)
 
-        if content := response["result"].get("content", []):
-            if item := content[0]:
-                text_result = item.get("text", "")
-                print(f"    ⚙️: {text_result}\n")
-                return text_result
+        # Fast path for the common single text block result, generic lookup covers other shapes
+        try:
+            text_result = response["result"]["content"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            text_result = self._extract_text_result(response)
+            if text_result is None:
+                return "Unexpected error occurred!"
+
+        logger.debug("`%s` result: %s", tool_name, text_result)
+        return text_result
+
+    async def call_tools_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Call several tools with a single JSON-RPC batch request
+
+        Returns:
+            list: Tool results in the order of `calls`; a failed call is represented by RuntimeError instance
+        """
+        if not self.http_session:
+            raise RuntimeError("MCP client not connected. Call connect() first.")
+
+        requests = [
+            self._build_request("tools/call", {"name": tool_name, "arguments": tool_args})
+            for tool_name, tool_args in calls
+        ]
+        response = await self._post(requests, self._headers)
+        if isinstance(response, dict) and "error" in response:
+            error = response["error"]
+            raise RuntimeError(f"MCP Error {error['code']}: {error['message']}")
+        if not isinstance(response, list):
+            raise RuntimeError(
+                f"Expected JSON-RPC batch response (list), got {type(response).__name__}; "
+                f"server may not support batching"
+            )
+
+        responses_by_id = {item.get("id"): item for item in response}
+        results = []
+        for request in requests:
+            item = responses_by_id.get(request["id"])
+            if item is None:
+                results.append(RuntimeError(f"No response for `{request['params']['name']}` call"))
+            elif "error" in item:
+                results.append(RuntimeError(f"MCP Error {item['error']['code']}: {item['error']['message']}"))
+            else:
+                text_result = self._extract_text_result(item)
+                results.append(text_result if text_result is not None else "Unexpected error occurred!")
+
+        return results
 
-        return "Unexpected error occurred!"
+    @staticmethod
+    def _extract_text_result(response: dict[str, Any]) -> Optional[str]:
+        """Get text of the first content item, None if tool result has no content"""
+        if content := (response.get("result") or {}).get("content", []):
+            if item := content[0]:
+                return item.get("text", "")
+        return None
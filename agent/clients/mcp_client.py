@@ -1,9 +1,13 @@
+import asyncio
+import logging
 from typing import Optional, Any
 
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.types import CallToolResult, TextContent
 
+logger = logging.getLogger(__name__)
+
 
 class MCPClient:
     """Handles MCP server connection and tool execution"""
@@ -11,8 +15,8 @@ class MCPClient:
     def __init__(self, mcp_server_url: str) -> None:
         self.server_url = mcp_server_url
         self.session: Optional[ClientSession] = None
-        self._streams_context = None
-        self._session_context = None
+        self._connection_task: Optional[asyncio.Task] = None
+        self._close_event: Optional[asyncio.Event] = None
 
     @classmethod
     async def create(cls, mcp_server_url: str) -> 'MCPClient':
@@ -23,14 +27,42 @@ class MCPClient:
 
     async def connect(self):
         """Connect to MCP server"""
-        self._streams_context = streamablehttp_client(self.server_url)
-        read_stream, write_stream, _ = await self._streams_context.__aenter__()
-
-        self._session_context = ClientSession(read_stream, write_stream)
-        self.session: ClientSession = await self._session_context.__aenter__()
-
-        init_result = await self.session.initialize()
-        print(init_result.model_dump_json(indent=2))
+        connected = asyncio.get_running_loop().create_future()
+        self._close_event = asyncio.Event()
+        self._connection_task = asyncio.create_task(self._hold_connection(connected))
+        await connected
+
+    async def _hold_connection(self, connected: asyncio.Future):
+        """Keep transport and session contexts open until close() is called
+
+        Contexts must be exited by the task that entered them, so they live in this dedicated task
+        and client can be used and closed from any other task.
+        """
+        try:
+            async with streamablehttp_client(self.server_url) as (read_stream, write_stream, _):
+                async with ClientSession(read_stream, write_stream) as session:
+                    init_result = await session.initialize()
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("MCP server initialized: %s", init_result.model_dump_json(indent=2))
+
+                    self.session = session
+                    connected.set_result(None)
+                    await self._close_event.wait()
+        except Exception as e:
+            if connected.done():
+                raise
+            connected.set_exception(e)
+        finally:
+            self.session = None
+            if not connected.done():
+                connected.cancel()
+
+    async def close(self):
+        """Close MCP session and transport"""
+        if self._connection_task:
+            self._close_event.set()
+            await self._connection_task
+            self._connection_task = None
 
     async def get_tools(self) -> list[dict[str, Any]]:
         """Get available tools from MCP server"""
@@ -55,12 +87,12 @@ class MCPClient:
         if not self.session:
             raise RuntimeError("MCP client not connected. Call connect() first.")
 
-        print(f"    Calling `{tool_name}` with {tool_args}")
+        logger.debug("Calling `%s` with %s", tool_name, tool_args)
 
         tool_result: CallToolResult = await self.session.call_tool(tool_name, tool_args)
         content = tool_result.content
 
-        print(f"    ⚙️: {content}\n")
+        logger.debug("`%s` result: %s", tool_name, content)
 
         if isinstance(content, TextContent):
             return content.text
@@ -1,65 +1,152 @@
-import json
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI, Response, Header
-from fastapi.responses import StreamingResponse
 import uvicorn
 
 from mcp_server.services.mcp_server import MCPServer
 from models.request import MCPRequest
 from models.response import MCPResponse, ErrorResponse
 
+logger = logging.getLogger(__name__)
+
 MCP_SESSION_ID_HEADER = "Mcp-Session-Id"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "warning").lower()
 
-# FastAPI app
-app = FastAPI(title="MCP Tools Server", version="1.0.0")
 mcp_server = MCPServer()
 
 
-def _validate_accept_header(accept_header: Optional[str]) -> bool:
-    """Validate that client accepts both JSON and SSE"""
-    if not accept_header:
-        return False
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Keep MCP server connections open for the whole application lifetime"""
+    await mcp_server.open()
+    try:
+        yield
+    finally:
+        await mcp_server.close()
+
+
+# FastAPI app
+app = FastAPI(title="MCP Tools Server", version="1.0.0", lifespan=lifespan)
+
+
+def _validate_accept_header(accept_header: str) -> bool:
+    """Validate that client accepts JSON or SSE (expects lowercased header)"""
+    return 'application/json' in accept_header or 'text/event-stream' in accept_header
 
-    accept_types = [t.strip().lower() for t in accept_header.split(',')]
-    has_json = any('application/json' in t for t in accept_types)
-    has_sse = any('text/event-stream' in t for t in accept_types)
 
-    return has_json and has_sse
+def _accepts_json(accept_header: str) -> bool:
+    """Check whether response can be sent as plain JSON instead of SSE (expects lowercased header)"""
+    return 'application/json' in accept_header
 
 async def _create_sse_stream(messages: list):
     """Create Server-Sent Events stream for responses"""
     for message in messages:
-        print(messages)
-        event_data = f"data: {json.dumps(message.dict(exclude_none=True))}\n\n"
-        yield event_data.encode('utf-8')
+        yield b"data: " + message.model_dump_json(exclude_none=True).encode() + b"\n\n"
 
     yield b"data: [DONE]\n\n"
 
+
+def _create_response(body: str, accept: str, session_id: str) -> Response:
+    """Wrap serialized JSON-RPC payload into plain JSON or single SSE event response"""
+    # Payload is always complete, so plain JSON is preferred and SSE is used only when JSON is not accepted
+    if _accepts_json(accept):
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={MCP_SESSION_ID_HEADER: session_id}
+        )
+
+    return Response(
+        content=b"data: " + body.encode() + b"\n\ndata: [DONE]\n\n",
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            MCP_SESSION_ID_HEADER: session_id
+        }
+    )
+
+
+async def _dispatch_request(request: MCPRequest) -> MCPResponse:
+    """Dispatch request of initialized session to MCP server handler"""
+    if request.method == "tools/list":
+        return mcp_server.handle_tools_list(request)
+    if request.method == "tools/call":
+        return await mcp_server.handle_tools_call(request)
+
+    return MCPResponse(
+        id=request.id,
+        error=ErrorResponse(
+            code=-32602,
+            message=f"Method '{request.method}' not found"
+        )
+    )
+
+
+async def _handle_batch(requests: list[MCPRequest], accept: str, session_id: str) -> Response:
+    """Handle JSON-RPC batch: requests are processed concurrently, notifications get no response
+
+    Notifications (`notifications/initialized` is the only one with an effect) are applied by the caller
+    before session readiness is checked, a batch from a session that is not initialized is rejected.
+    """
+    if not requests:
+        error_response = MCPResponse(
+            id="server-error",
+            error=ErrorResponse(
+                code=-32600,
+                message="Empty batch"
+            )
+        )
+        return Response(
+            status_code=400,
+            content=error_response.model_dump_json(exclude_none=True),
+            media_type="application/json"
+        )
+
+    mcp_responses = await asyncio.gather(
+        *(_dispatch_request(request) for request in requests if request.id is not None)
+    )
+    if not mcp_responses:
+        return Response(
+            status_code=202,
+            headers={MCP_SESSION_ID_HEADER: session_id},
+        )
+
+    body = "[" + ",".join(r.model_dump_json(exclude_none=True) for r in mcp_responses) + "]"
+    return _create_response(body, accept, session_id)
+
+
 @app.post("/mcp")
 async def handle_mcp_request(
-        request: MCPRequest,
+        request: MCPRequest | list[MCPRequest],
         response: Response,
         accept: Optional[str] = Header(None),
         mcp_session_id: Optional[str] = Header(None, alias=MCP_SESSION_ID_HEADER)
 ):
     """Single MCP endpoint handling all JSON-RPC requests with proper session management"""
     # Validate Accept header for all requests
+    accept = accept.lower() if accept else ""
     if not _validate_accept_header(accept):
         error_response = MCPResponse(
             id="server-error",
             error=ErrorResponse(
                 code=-32600,
-                message="Client must accept both application/json and text/event-stream"
+                message="Client must accept application/json or text/event-stream"
             )
         )
         return Response(
             status_code=406,
-            content=error_response.model_dump_json(),
+            content=error_response.model_dump_json(exclude_none=True),
             media_type="application/json"
         )
 
+    is_batch = isinstance(request, list)
+
     # Handle initialization (no session required)
-    if request.method == "initialize":
+    if not is_batch and request.method == "initialize":
         mcp_response, session_id = mcp_server.handle_initialize(request)
 
         if session_id:
@@ -77,7 +164,7 @@ async def handle_mcp_request(
             )
             return Response(
                 status_code=400,
-                content=error_response.model_dump_json(),
+                content=error_response.model_dump_json(exclude_none=True),
                 media_type="application/json"
             )
 
@@ -89,14 +176,19 @@ async def handle_mcp_request(
             )
 
         # Handle notifications that don't need responses
-        if request.method == "notifications/initialized":
+        if not is_batch and request.method == "notifications/initialized":
             session.ready_for_operation = True
-            print("Client initialization complete")
+            logger.info("Client initialization complete")
             return Response(
                 status_code=202,
                 headers={MCP_SESSION_ID_HEADER: session.session_id},
             )
 
+        # Notifications in batch are applied before its requests, so `initialized` may share a batch with them
+        if is_batch and any(r.id is None and r.method == "notifications/initialized" for r in request):
+            session.ready_for_operation = True
+            logger.info("Client initialization complete")
+
         # Handle different MCP methods
         if not session.ready_for_operation:
             error_response = MCPResponse(
@@ -108,39 +200,29 @@ async def handle_mcp_request(
             )
             return Response(
                 status_code=400,
-                content=error_response.model_dump_json(),
+                content=error_response.model_dump_json(exclude_none=True),
                 media_type="application/json"
             )
 
-        if request.method == "tools/list":
-            mcp_response = mcp_server.handle_tools_list(request)
-        elif request.method == "tools/call":
-            mcp_response = await mcp_server.handle_tools_call(request)
-        else:
-            mcp_response = MCPResponse(
-                id=request.id,
-                error=ErrorResponse(
-                    code=-32602,
-                    message=f"Method '{request.method}' not found"
-                )
-            )
+        if is_batch:
+            return await _handle_batch(request, accept, mcp_session_id)
 
-    return StreamingResponse(
-        content=_create_sse_stream([mcp_response]),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            MCP_SESSION_ID_HEADER: mcp_session_id
-        }
-    )
+        mcp_response = await _dispatch_request(request)
+
+    return _create_response(mcp_response.model_dump_json(exclude_none=True), accept, mcp_session_id)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=LOG_LEVEL.upper())
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=8006,
-        reload=True,
-        log_level="debug"
+        reload=os.getenv("DEV") == "1",
+        log_level=LOG_LEVEL,
+        http="httptools",
+        # uvicorn drops idle keep-alive connections after 5s by default, so clients pausing between calls reconnect
+        timeout_keep_alive=75,
+        # uvloop when it's installed (it's not available on Windows), asyncio loop otherwise
+        loop="auto"
     )
@@ -1,5 +1,7 @@
-import uuid
-import asyncio
+import logging
+import secrets
+import time
+from typing import Any, Awaitable, Callable
 
 from mcp_server.models.request import MCPRequest
 from mcp_server.models.response import MCPResponse, ErrorResponse
@@ -10,6 +12,8 @@ from mcp_server.tools.users.search_users_tool import SearchUsersTool
 from mcp_server.tools.users.update_user_tool import UpdateUserTool
 from mcp_server.tools.users.user_client import UserClient
 
+logger = logging.getLogger(__name__)
+
 
 class MCPSession:
     """Represents an MCP session with state management"""
@@ -17,7 +21,7 @@ class MCPSession:
     def __init__(self, session_id: str):
         self.session_id = session_id
         self.ready_for_operation = False
-        self.created_at = asyncio.get_event_loop().time()
+        self.created_at = time.monotonic()
         self.last_activity = self.created_at
 
 
@@ -33,19 +37,33 @@ class MCPServer:
         # Session management
         self.sessions: dict[str, MCPSession] = {}
         self.tools = {}
+        self._dispatch: dict[str, Callable[[dict[str, Any]], Awaitable[str]]] = {}
+        self._user_client = UserClient()
         self._register_tools()
 
+        # Tools are static after registration, so `tools/list` result is built only once
+        self._tools_list_result = {"tools": [tool.to_mcp_tool() for tool in self.tools.values()]}
+
     def _register_tools(self):
         """Register all available tools"""
-        user_client = UserClient()
         for tool in [
-            GetUserByIdTool(user_client),
-            SearchUsersTool(user_client),
-            CreateUserTool(user_client),
-            UpdateUserTool(user_client),
-            DeleteUserTool(user_client),
+            GetUserByIdTool(self._user_client),
+            SearchUsersTool(self._user_client),
+            CreateUserTool(self._user_client),
+            UpdateUserTool(self._user_client),
+            DeleteUserTool(self._user_client),
         ]:
             self.tools[tool.name] = tool
+            # Bound `execute` methods are resolved once here instead of on every call
+            self._dispatch[tool.name] = tool.execute
+
+    async def open(self):
+        """Open connections shared by all tool calls, called once on application startup"""
+        await self._user_client.open()
+
+    async def close(self):
+        """Close shared connections, called once on application shutdown"""
+        await self._user_client.close()
 
     def _validate_protocol_version(self, client_version: str) -> str:
         """Validate and negotiate protocol version"""
@@ -58,12 +76,12 @@ class MCPServer:
         """Get an existing session"""
         session = self.sessions.get(session_id)
         if session:
-            session.last_activity = asyncio.get_event_loop().time()
+            session.last_activity = time.monotonic()
         return session
 
     def handle_initialize(self, request: MCPRequest) -> tuple[MCPResponse, str]:
         """Handle initialization request with session creation"""
-        session_id = str(uuid.uuid4()).replace("-", "")
+        session_id = secrets.token_hex(16)
         session = MCPSession(session_id)
         self.sessions[session_id] = session
 
@@ -85,10 +103,9 @@ class MCPServer:
 
     def handle_tools_list(self, request: MCPRequest) -> MCPResponse:
         """Handle tools/list request"""
-        tools_list = [tool.to_mcp_tool() for tool in self.tools.values()]
         return MCPResponse(
             id=request.id,
-            result={"tools": tools_list}
+            result=self._tools_list_result
         )
 
     async def handle_tools_call(self, request: MCPRequest) -> MCPResponse:
@@ -106,7 +123,7 @@ class MCPServer:
         # Extract tool name and arguments according to MCP spec
         tool_name = request.params.get("name")
         arguments = request.params.get("arguments", {})
-        print(request)
+        logger.debug("Tool call request: %s", request)
 
         if not tool_name:
             return MCPResponse(
@@ -117,7 +134,8 @@ class MCPServer:
                 )
             )
 
-        if tool_name not in self.tools:
+        execute = self._dispatch.get(tool_name)
+        if execute is None:
             return MCPResponse(
                 id=request.id,
                 error=ErrorResponse(
@@ -126,10 +144,8 @@ class MCPServer:
                 )
             )
 
-        tool = self.tools[tool_name]
-
         try:
-            result_text = await tool.execute(arguments)
+            result_text = await execute(arguments)
             return MCPResponse(
                 id=request.id,
                 result={
@@ -5,6 +5,7 @@ from mcp_server.tools.users.base import BaseUserServiceTool
 
 
 class CreateUserTool(BaseUserServiceTool):
+    _INPUT_SCHEMA = UserCreate.model_json_schema()
 
     @property
     def name(self) -> str:
@@ -16,7 +17,7 @@ class CreateUserTool(BaseUserServiceTool):
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return UserCreate.model_json_schema()
+        return self._INPUT_SCHEMA
 
     async def execute(self, arguments: dict[str, Any]) -> str:
         user = UserCreate.model_validate(arguments)
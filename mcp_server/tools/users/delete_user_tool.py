@@ -4,6 +4,16 @@ from mcp_server.tools.users.base import BaseUserServiceTool
 
 
 class DeleteUserTool(BaseUserServiceTool):
+    _INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "id": {
+                "type": "number",
+                "description": "User ID"
+            }
+        },
+        "required": ["id"]
+    }
 
     @property
     def name(self) -> str:
@@ -15,16 +25,7 @@ class DeleteUserTool(BaseUserServiceTool):
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "id": {
-                    "type": "number",
-                    "description": "User ID"
-                }
-            },
-            "required": ["id"]
-        }
+        return self._INPUT_SCHEMA
 
     async def execute(self, arguments: dict[str, Any]) -> str:
         user_id = int(arguments["id"])
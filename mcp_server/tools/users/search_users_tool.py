@@ -4,6 +4,32 @@ from mcp_server.tools.users.base import BaseUserServiceTool
 
 
 class SearchUsersTool(BaseUserServiceTool):
+    _INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "User name"
+            },
+            "surname": {
+                "type": "string",
+                "description": "User surname"
+            },
+            "email": {
+                "type": "string",
+                "description": "User email"
+            },
+            "gender": {
+                "type": "string",
+                "description": "User gender",
+                "enum": [
+                    "male",
+                    "female"
+                ],
+            },
+        },
+        "required": []
+    }
 
     @property
     def name(self) -> str:
@@ -15,32 +41,7 @@ class SearchUsersTool(BaseUserServiceTool):
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "User name"
-                },
-                "surname": {
-                    "type": "string",
-                    "description": "User surname"
-                },
-                "email": {
-                    "type": "string",
-                    "description": "User email"
-                },
-                "gender": {
-                    "type": "string",
-                    "description": "User gender",
-                    "enum": [
-                        "male",
-                        "female"
-                    ],
-                },
-            },
-            "required": []
-        }
+        return self._INPUT_SCHEMA
 
     async def execute(self, arguments: dict[str, Any]) -> str:
         return await self._user_client.search_users(**arguments)
@@ -5,6 +5,17 @@ from mcp_server.tools.users.base import BaseUserServiceTool
 
 
 class UpdateUserTool(BaseUserServiceTool):
+    _INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "id": {
+                "type": "number",
+                "description": "User ID that should be updated."
+            },
+            "new_info": UserUpdate.model_json_schema()
+        },
+        "required": ["id"]
+    }
 
     @property
     def name(self) -> str:
@@ -16,17 +27,7 @@ class UpdateUserTool(BaseUserServiceTool):
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "id": {
-                    "type": "number",
-                    "description": "User ID that should be updated."
-                },
-                "new_info": UserUpdate.model_json_schema()
-            },
-            "required": ["id"]
-        }
+        return self._INPUT_SCHEMA
 
     async def execute(self, arguments: dict[str, Any]) -> str:
         user_id = arguments["id"]
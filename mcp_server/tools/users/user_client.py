@@ -1,14 +1,45 @@
+import logging
 import os
 from typing import Any, Optional
 
-import requests
+import aiohttp
 
 from mcp_server.models.user_info import UserUpdate, UserCreate
 
+logger = logging.getLogger(__name__)
+
 USER_SERVICE_ENDPOINT = os.getenv("USERS_MANAGEMENT_SERVICE_URL", "http://localhost:8041")
 
 class UserClient:
 
+    def __init__(self) -> None:
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def open(self) -> None:
+        """Create HTTP session shared by all tool calls, so they reuse one connection pool"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Content-Type": "application/json"}
+            )
+
+    async def close(self) -> None:
+        """Close shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            await self.open()
+        return self._session
+
     def __user_to_string(self, user: dict[str, Any]):
         user_str = "```\n"
         for key, value in user.items():
@@ -26,15 +57,14 @@ class UserClient:
         return users_str
 
     async def get_user(self, user_id: int) -> str:
-        headers = {"Content-Type": "application/json"}
+        session = await self._get_session()
 
-        response = requests.get(url=f"{USER_SERVICE_ENDPOINT}/v1/users/{user_id}", headers=headers)
+        async with session.get(f"{USER_SERVICE_ENDPOINT}/v1/users/{user_id}") as response:
+            if response.status == 200:
+                data = await response.json()
+                return self.__user_to_string(data)
 
-        if response.status_code == 200:
-            data = response.json()
-            return self.__user_to_string(data)
-
-        raise Exception(f"HTTP {response.status_code}: {response.text}")
+            raise Exception(f"HTTP {response.status}: {await response.text()}")
 
     async def search_users(
             self,
@@ -43,7 +73,7 @@ class UserClient:
             email: Optional[str] = None,
             gender: Optional[str] = None,
     ) -> str:
-        headers = {"Content-Type": "application/json"}
+        session = await self._get_session()
 
         params = {}
         if name:
@@ -55,49 +85,43 @@ class UserClient:
         if gender:
             params["gender"] = gender
 
-        response = requests.get(url=USER_SERVICE_ENDPOINT + "/v1/users/search", headers=headers, params=params)
-
-        if response.status_code == 200:
-            data = response.json()
-            print(f"Get {len(data)} users successfully")
-            return self.__users_to_string(data)
+        async with session.get(USER_SERVICE_ENDPOINT + "/v1/users/search", params=params) as response:
+            if response.status == 200:
+                data = await response.json()
+                logger.debug("Get %d users successfully", len(data))
+                return self.__users_to_string(data)
 
-        raise Exception(f"HTTP {response.status_code}: {response.text}")
+            raise Exception(f"HTTP {response.status}: {await response.text()}")
 
     async def add_user(self, user_create_model: UserCreate) -> str:
-        headers = {"Content-Type": "application/json"}
+        session = await self._get_session()
 
-        response = requests.post(
-            url=f"{USER_SERVICE_ENDPOINT}/v1/users",
-            headers=headers,
-            json=user_create_model.model_dump()
-        )
+        async with session.post(
+                f"{USER_SERVICE_ENDPOINT}/v1/users",
+                json=user_create_model.model_dump()
+        ) as response:
+            if response.status == 201:
+                return f"User successfully added: {await response.text()}"
 
-        if response.status_code == 201:
-            return f"User successfully added: {response.text}"
-
-        raise Exception(f"HTTP {response.status_code}: {response.text}")
+            raise Exception(f"HTTP {response.status}: {await response.text()}")
 
     async def update_user(self, user_id: int, user_update_model: UserUpdate) -> str:
-        headers = {"Content-Type": "application/json"}
-
-        response = requests.put(
-            url=f"{USER_SERVICE_ENDPOINT}/v1/users/{user_id}",
-            headers=headers,
-            json=user_update_model.model_dump()
-        )
+        session = await self._get_session()
 
-        if response.status_code == 201:
-            return f"User successfully updated: {response.text}"
+        async with session.put(
+                f"{USER_SERVICE_ENDPOINT}/v1/users/{user_id}",
+                json=user_update_model.model_dump()
+        ) as response:
+            if response.status == 201:
+                return f"User successfully updated: {await response.text()}"
 
-        raise Exception(f"HTTP {response.status_code}: {response.text}")
+            raise Exception(f"HTTP {response.status}: {await response.text()}")
 
     async def delete_user(self, user_id: int) -> str:
-        headers = {"Content-Type": "application/json"}
-
-        response = requests.delete(url=f"{USER_SERVICE_ENDPOINT}/v1/users/{user_id}", headers=headers)
+        session = await self._get_session()
 
-        if response.status_code == 204:
-            return "User successfully deleted"
+        async with session.delete(f"{USER_SERVICE_ENDPOINT}/v1/users/{user_id}") as response:
+            if response.status == 204:
+                return "User successfully deleted"
 
-        raise Exception(f"HTTP {response.status_code}: {response.text}")
+            raise Exception(f"HTTP {response.status}: {await response.text()}")
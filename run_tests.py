@@ -53,11 +53,11 @@ def run_command(cmd, check=True, shell=False):
 def check_service(url, method="GET", data=None, headers=None):
     """Check if a service is running"""
     try:
-        import requests
+        import httpx
         if method == "GET":
-            response = requests.get(url, timeout=5)
+            response = httpx.get(url, timeout=5)
         else:
-            response = requests.post(url, json=data, headers=headers, timeout=5)
+            response = httpx.post(url, json=data, headers=headers, timeout=5)
         return response.status_code in [200, 202]
     except Exception:
         return False
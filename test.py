@@ -3,297 +3,583 @@ Comprehensive test suite for Advanced MCP Implementation
 Tests both MCPClient (library) and CustomMCPClient (pure Python)
 """
 import asyncio
+import io
+import json
 import os
 import sys
-from pathlib import Path
-import subprocess
+import textwrap
 import time
-import requests
+import traceback
+from contextvars import ContextVar
+from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+import httpx
 
-from agent.clients.custom_mcp_client import CustomMCPClient
+# Add project root to path, unless it's already there (e.g. script is run from project root)
+_ROOT = str(Path(__file__).resolve().parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from agent.clients.custom_mcp_client import CustomMCPClient, SSEDecoder
 from agent.clients.mcp_client import MCPClient
 from agent.clients.dial_client import DialClient
 from agent.models.message import Message, Role
 
+LOCAL_MCP_URL = "http://localhost:8006/mcp"
+FETCH_MCP_URL = "https://remote.mcpservers.org/fetch/mcp"
+DIAL_API_KEY: str | None = os.environ.get("DIAL_API_KEY")
+# Successful health check is remembered for a few seconds to speed up re-runs, MCP_SKIP_HEALTH_TTL=0 disables it
+HEALTH_CACHE_PATH = Path.home() / ".cache" / "ai-dial-mcp" / "health.json"
+HEALTH_CACHE_TTL = float(os.environ.get("MCP_SKIP_HEALTH_TTL", "10"))
+
+_EQ = "=" * 100
+_DASH = "-" * 100
+_EMOJI = "🎯" * 50
+
+_USER_SVC_HELP = textwrap.indent(textwrap.dedent("""\
+    ❌ User service is NOT running!
+
+    Please start Docker user service:
+    → docker compose up -d
+
+    Or in WSL:
+    → cd /mnt/c/Users/AndreyPopov/ai-dial-mcp-advanced && docker compose up -d"""), "   ")
+_MCP_SVC_HELP = textwrap.indent(textwrap.dedent("""\
+    ❌ MCP server is NOT running!
+
+    Please start MCP server in a separate terminal:
+    → python mcp_server/server.py
+
+    Or in WSL:
+    → cd /mnt/c/Users/AndreyPopov/ai-dial-mcp-advanced
+    → source .venv/bin/activate
+    → export DIAL_API_KEY='your_api_key'
+    → python mcp_server/server.py"""), "   ")
+_KEY_HELP = textwrap.indent(textwrap.dedent("""\
+    ❌ DIAL_API_KEY environment variable is not set!
+
+    Please set it:
+    → export DIAL_API_KEY='your_dial_api_key'"""), "   ")
+
+_SYSTEM_MSG = Message(
+    role=Role.SYSTEM,
+    content="You are an advanced AI agent. Your goal is to assist user with his questions."
+)
+_USER_MSG = Message(
+    role=Role.USER,
+    content="Check if Arkadiy Dobkin present as a user, if not then search info about him in the web and add him"
+)
+
+_SESSION: httpx.AsyncClient | None = None
+_TOOLS_CACHE: dict[tuple[type, str], asyncio.Task] = {}
+_CLIENTS: dict[tuple[type, str], asyncio.Task] = {}
+_PREWARM_TASKS: set[asyncio.Task] = set()
+_TRACEBACKS: list[str] = []
+_OUTPUT: ContextVar[io.StringIO | None] = ContextVar("_OUTPUT", default=None)
+
+
+class _TaskStdout(io.TextIOBase):
+    """Routes output of concurrently running tests into per-test buffers"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _OUTPUT.get()
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        if _OUTPUT.get() is None:
+            self._stream.flush()
+
+
+def get_session() -> httpx.AsyncClient:
+    """Get HTTP client shared by health probes and custom MCP clients, so connections are reused"""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=8, keepalive_expiry=30),
+            timeout=httpx.Timeout(30.0)
+        )
+    return _SESSION
+
+
+async def get_or_create(cls: type[MCPClient] | type[CustomMCPClient], url: str, **kwargs):
+    """Get MCP client shared by all tests, so only one initialize handshake is done per client class and URL"""
+    key = (cls, url)
+    if key not in _CLIENTS:
+        _CLIENTS[key] = asyncio.ensure_future(cls.create(url, **kwargs))
+    try:
+        return await asyncio.shield(_CLIENTS[key])
+    except Exception:
+        _CLIENTS.pop(key, None)
+        raise
+
+
+async def close_clients():
+    """Close all shared MCP clients"""
+    for task in _CLIENTS.values():
+        if task.done() and not task.cancelled() and task.exception() is None:
+            try:
+                await task.result().close()
+            except Exception as e:
+                print(f"⚠️  Failed to close MCP client: {e}")
+    _CLIENTS.clear()
+
+
+async def cached_get_tools(client: MCPClient | CustomMCPClient, url: str) -> list[dict]:
+    """Get tools of MCP server once per client type and URL, concurrent callers share one request"""
+    key = (type(client), url)
+    if key not in _TOOLS_CACHE:
+        _TOOLS_CACHE[key] = asyncio.ensure_future(client.get_tools())
+    try:
+        return await asyncio.shield(_TOOLS_CACHE[key])
+    except Exception:
+        _TOOLS_CACHE.pop(key, None)
+        raise
+
+
+def _prewarm_task_done(task: asyncio.Task):
+    _PREWARM_TASKS.discard(task)
+    if not task.cancelled():
+        task.exception()
+
+
+def prewarm_connections():
+    """Open keep-alive connection to remote fetch server in background, so agent test skips DNS and TLS handshake"""
+    task = asyncio.create_task(get_session().head(FETCH_MCP_URL, timeout=5))
+    _PREWARM_TASKS.add(task)
+    task.add_done_callback(_prewarm_task_done)
+
+
+async def close_session():
+    """Close shared HTTP client"""
+    global _SESSION
+    for task in list(_PREWARM_TASKS):
+        task.cancel()
+    await asyncio.gather(*_PREWARM_TASKS, return_exceptions=True)
+    if _SESSION is not None:
+        await _SESSION.aclose()
+        _SESSION = None
+
+
+class FatalProbeError(Exception):
+    """Service probe failed, remaining probes are cancelled since tests can't run anyway"""
+
+
+async def _check_user_service(client: httpx.AsyncClient) -> str:
+    """Probe Docker user service health endpoint, only status is checked so body is never read"""
+    try:
+        async with client.stream("GET", "http://localhost:8041/health", timeout=5) as response:
+            response.raise_for_status()
+        return "   ✅ User service is running"
+    except httpx.ConnectError:
+        raise FatalProbeError(_USER_SVC_HELP)
+    except Exception as e:
+        raise FatalProbeError(f"   ❌ Error checking user service: {e}")
+
+
+async def _check_mcp_server(client: httpx.AsyncClient) -> str:
+    """Probe MCP server with OPTIONS request, any non-5xx status (even 405) means server is listening"""
+    try:
+        async with client.stream("OPTIONS", LOCAL_MCP_URL, timeout=2) as response:
+            status_code = response.status_code
+        if status_code < 500:
+            return "   ✅ MCP server is running"
+        raise Exception(f"Unexpected status: {status_code}")
+    except httpx.ConnectError:
+        raise FatalProbeError(_MCP_SVC_HELP)
+    except Exception as e:
+        raise FatalProbeError(f"   ❌ Error checking MCP server: {e}")
+
+
+def _read_health_cache() -> float | None:
+    """Get age in seconds of last successful health check, None if it's missing or expired"""
+    if HEALTH_CACHE_TTL <= 0:
+        return None
+    try:
+        age = time.time() - json.loads(HEALTH_CACHE_PATH.read_text())["ts"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return age if 0 <= age < HEALTH_CACHE_TTL else None
+
+
+def _write_health_cache():
+    """Remember successful health check"""
+    if HEALTH_CACHE_TTL <= 0:
+        return
+    try:
+        HEALTH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        HEALTH_CACHE_PATH.write_text(json.dumps({"ts": time.time(), "ok": True}))
+    except OSError:
+        pass
+
+
+def _check_dial_api_key() -> tuple[bool, str]:
+    """Check that DIAL API key is configured"""
+    if not DIAL_API_KEY:
+        return False, _KEY_HELP
+    return True, f"   ✅ DIAL_API_KEY is set: {DIAL_API_KEY[:10]}..."
+
 
 async def check_services():
     """Check if required services are running"""
-    print("\n" + "=" * 100)
+    print("\n" + _EQ)
     print("SERVICE HEALTH CHECK")
-    print("=" * 100)
-    
-    # Check Docker user service
-    print("\n1. Checking Docker User Service...")
-    try:
-        response = requests.get("http://localhost:8041/health", timeout=5)
-        response.raise_for_status()
-        print(f"   ✅ User service is running: {response.json()}")
-    except requests.exceptions.ConnectionError:
-        print("   ❌ User service is NOT running!")
-        print("\n   Please start Docker user service:")
-        print("   → docker compose up -d")
-        print("\n   Or in WSL:")
-        print("   → cd /mnt/c/Users/AndreyPopov/ai-dial-mcp-advanced && docker compose up -d")
-        return False
-    except Exception as e:
-        print(f"   ❌ Error checking user service: {e}")
+    print(_EQ)
+
+    # API key check is free, so it goes first and skips network probes when it fails
+    print("\n1. Checking DIAL API Key...")
+    ok, message = _check_dial_api_key()
+    print(message)
+    if not ok:
         return False
-    
-    # Check MCP Server
-    print("\n2. Checking MCP Server...")
+
+    cache_age = _read_health_cache()
+    if cache_age is not None:
+        print(f"\n✅ Services were healthy {cache_age:.1f}s ago, skipping network probes")
+        prewarm_connections()
+        return True
+
+    # Probes run concurrently, the first failure cancels the rest; results are reported in fixed order
+    client = get_session()
+    probes = (
+        ("2. Checking Docker User Service...", _check_user_service),
+        ("3. Checking MCP Server...", _check_mcp_server),
+    )
+    all_ok = True
     try:
-        # Try to make a simple request to MCP server
-        response = requests.post(
-            "http://localhost:8006/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "id": "health-check",
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {"name": "test-client", "version": "1.0.0"}
-                }
-            },
-            headers={
-                "Content-Type": "application/json",
-                "Accept": "application/json, text/event-stream"
-            },
-            timeout=5
-        )
-        if response.status_code in [200, 202]:
-            print("   ✅ MCP server is running")
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(probe(client)) for _, probe in probes]
+    except* FatalProbeError:
+        all_ok = False
+
+    for (title, _), task in zip(probes, tasks):
+        print(f"\n{title}")
+        if task.cancelled():
+            print("   ⏭️  Skipped")
+        elif task.exception() is not None:
+            print(task.exception())
         else:
-            raise Exception(f"Unexpected status: {response.status_code}")
-    except requests.exceptions.ConnectionError:
-        print("   ❌ MCP server is NOT running!")
-        print("\n   Please start MCP server in a separate terminal:")
-        print("   → python mcp_server/server.py")
-        print("\n   Or in WSL:")
-        print("   → cd /mnt/c/Users/AndreyPopov/ai-dial-mcp-advanced")
-        print("   → source .venv/bin/activate")
-        print("   → export DIAL_API_KEY='your_api_key'")
-        print("   → python mcp_server/server.py")
-        return False
-    except Exception as e:
-        print(f"   ❌ Error checking MCP server: {e}")
-        return False
-    
-    # Check DIAL API key
-    print("\n3. Checking DIAL API Key...")
-    dial_api_key = os.getenv("DIAL_API_KEY")
-    if not dial_api_key:
-        print("   ❌ DIAL_API_KEY environment variable is not set!")
-        print("\n   Please set it:")
-        print("   → export DIAL_API_KEY='your_dial_api_key'")
+            print(task.result())
+
+    if not all_ok:
         return False
-    else:
-        print(f"   ✅ DIAL_API_KEY is set: {dial_api_key[:10]}...")
-    
-    print("\n" + "=" * 100)
+    _write_health_cache()
+    prewarm_connections()
+
+    print("\n" + _EQ)
     print("✅ All services are ready!")
-    print("=" * 100 + "\n")
+    print(_EQ + "\n")
     return True
 
 
 async def test_mcp_client_library():
     """Test with MCPClient (library-based)"""
-    print("\n" + "=" * 100)
+    print("\n" + _EQ)
     print("TEST 1: MCP CLIENT (Library-based)")
-    print("=" * 100)
+    print(_EQ)
     
     try:
         print("\n→ Connecting to local MCP server (http://localhost:8006/mcp)...")
-        client = await MCPClient.create("http://localhost:8006/mcp")
+        client = await get_or_create(MCPClient, LOCAL_MCP_URL)
         
         print("\n→ Fetching available tools...")
-        tools = await client.get_tools()
+        tools = await cached_get_tools(client, LOCAL_MCP_URL)
         print(f"   Found {len(tools)} tools:")
-        for tool in tools:
-            tool_name = tool.get('function', {}).get('name', 'unknown')
-            print(f"   - {tool_name}")
+        print("\n".join(f"   - {tool.get('function', {}).get('name', 'unknown')}" for tool in tools))
         
-        # Test get_user_by_id
-        print("\n→ Testing tool: get_user_by_id (ID=1)")
-        result = await client.call_tool("get_user_by_id", {"id": 1})
-        print(f"   Result preview: {result[:200]}...")
-        
-        # Test search_users
-        print("\n→ Testing tool: search_users (name='John')")
-        result = await client.call_tool("search_users", {"name": "John"})
-        print(f"   Result preview: {result[:200]}...")
+        # Tool calls are independent, so they are sent concurrently
+        print("\n→ Testing tools: get_user_by_id (ID=1) and search_users (name='John')")
+        user_result, search_result = await asyncio.gather(
+            client.call_tool("get_user_by_id", {"id": 1}),
+            client.call_tool("search_users", {"name": "John"})
+        )
+        print(f"   get_user_by_id result preview: {user_result[:200]}...")
+        print(f"   search_users result preview: {search_result[:200]}...")
         
         print("\n✅ MCPClient test PASSED")
         return True
         
     except Exception as e:
         print(f"\n❌ MCPClient test FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+        _TRACEBACKS.append(traceback.format_exc())
         return False
 
 
 async def test_custom_mcp_client():
     """Test with CustomMCPClient (pure Python)"""
-    print("\n" + "=" * 100)
+    print("\n" + _EQ)
     print("TEST 2: CUSTOM MCP CLIENT (Pure Python)")
-    print("=" * 100)
+    print(_EQ)
     
     try:
         print("\n→ Connecting to local MCP server (http://localhost:8006/mcp)...")
-        client = await CustomMCPClient.create("http://localhost:8006/mcp")
+        client = await get_or_create(CustomMCPClient, LOCAL_MCP_URL, session=get_session())
         
         print("\n→ Fetching available tools...")
-        tools = await client.get_tools()
+        tools = await cached_get_tools(client, LOCAL_MCP_URL)
         print(f"   Found {len(tools)} tools:")
-        for tool in tools:
-            tool_name = tool.get('function', {}).get('name', 'unknown')
-            print(f"   - {tool_name}")
-        
-        # Test get_user_by_id
-        print("\n→ Testing tool: get_user_by_id (ID=2)")
-        result = await client.call_tool("get_user_by_id", {"id": 2})
-        print(f"   Result preview: {result[:200]}...")
+        print("\n".join(f"   - {tool.get('function', {}).get('name', 'unknown')}" for tool in tools))
         
-        # Test search_users
-        print("\n→ Testing tool: search_users (gender='female')")
-        result = await client.call_tool("search_users", {"gender": "female"})
-        print(f"   Result preview: {result[:200]}...")
+        # Tool calls are independent, so they are sent concurrently
+        print("\n→ Testing tools: get_user_by_id (ID=2) and search_users (gender='female')")
+        user_result, search_result = await asyncio.gather(
+            client.call_tool("get_user_by_id", {"id": 2}),
+            client.call_tool("search_users", {"gender": "female"})
+        )
+        print(f"   get_user_by_id result preview: {user_result[:200]}...")
+        print(f"   search_users result preview: {search_result[:200]}...")
+
+        print("\n→ Testing JSON-RPC batch: get_user_by_id (ID=1), unknown tool, get_user_by_id (ID=2)")
+        batch_results = await client.call_tools_batch([
+            ("get_user_by_id", {"id": 1}),
+            ("no_such_tool", {}),
+            ("get_user_by_id", {"id": 2}),
+        ])
+        assert len(batch_results) == 3, f"Expected 3 batch results, got {len(batch_results)}"
+        assert "id: 1" in batch_results[0] and "id: 2" in batch_results[2], "Batch results are not in call order"
+        assert isinstance(batch_results[1], RuntimeError), f"Unknown tool should fail, got: {batch_results[1]!r}"
+        print(f"   Unknown tool error: {batch_results[1]}")
+
+        print("\n→ Testing JSON-RPC batch with notifications/initialized on a fresh session...")
+        await _check_batch_with_initialized_notification()
+        print("   Batch initialized session and returned tools/list response")
         
         print("\n✅ CustomMCPClient test PASSED")
-        
-        # Clean up
-        if client.http_session:
-            await client.http_session.close()
-        
         return True
         
     except Exception as e:
         print(f"\n❌ CustomMCPClient test FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+        _TRACEBACKS.append(traceback.format_exc())
         return False
 
 
+async def _check_batch_with_initialized_notification():
+    """Initialize raw session and send `notifications/initialized` with `tools/list` in the same batch"""
+    client = get_session()
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    response = await client.post(
+        LOCAL_MCP_URL,
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "test-client", "version": "1.0.0"}
+            }
+        },
+        headers=headers
+    )
+    response.raise_for_status()
+    headers["Mcp-Session-Id"] = response.headers["Mcp-Session-Id"]
+
+    response = await client.post(
+        LOCAL_MCP_URL,
+        json=[
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        ],
+        headers=headers
+    )
+    assert response.status_code == 200, f"Unexpected batch status: {response.status_code} {response.text[:200]}"
+    body = response.json()
+    assert isinstance(body, list) and len(body) == 1, f"Expected single batch response, got: {body!r}"
+    assert body[0].get("id") == 2 and body[0].get("result", {}).get("tools"), f"Unexpected response: {body[0]!r}"
+
+
 async def test_agent_with_query():
     """Test the full agent with a real query"""
-    print("\n" + "=" * 100)
+    print("\n" + _EQ)
     print("TEST 3: FULL AGENT WITH REAL QUERY")
-    print("=" * 100)
+    print(_EQ)
     
     try:
         print("\n→ Setting up multi-client agent...")
         
-        # Collect tools from local MCP server
+        # Collect tools from local MCP server and remote fetch server (optional), both are set up concurrently
         tools = []
         tool_name_client_map = {}
         
-        print("\n→ Connecting to local MCP server...")
-        ums_mcp_client = await MCPClient.create("http://localhost:8006/mcp")
-        for tool in await ums_mcp_client.get_tools():
-            tools.append(tool)
-            tool_name_client_map[tool.get('function', {}).get('name')] = ums_mcp_client
-        print(f"   ✅ Collected {len(tools)} tools from local server")
-        
-        # Try to connect to remote fetch server (optional)
-        print("\n→ Attempting to connect to remote fetch server...")
-        try:
-            fetch_mcp_client = await CustomMCPClient.create("https://remote.mcpservers.org/fetch/mcp")
-            fetch_tools = await fetch_mcp_client.get_tools()
-            for tool in fetch_tools:
+        print("\n→ Connecting to local MCP server and remote fetch server...")
+        ums_mcp_client, fetch_mcp_client = await asyncio.gather(
+            get_or_create(MCPClient, LOCAL_MCP_URL),
+            get_or_create(CustomMCPClient, FETCH_MCP_URL, session=get_session()),
+            return_exceptions=True
+        )
+        if isinstance(ums_mcp_client, BaseException):
+            raise ums_mcp_client
+
+        clients = {"local server": (LOCAL_MCP_URL, ums_mcp_client)}
+        if isinstance(fetch_mcp_client, BaseException):
+            print(f"   ⚠️  Remote fetch server unavailable (this is OK): {fetch_mcp_client}")
+        else:
+            clients["remote fetch server"] = (FETCH_MCP_URL, fetch_mcp_client)
+
+        client_tools_list = await asyncio.gather(
+            *(cached_get_tools(client, url) for url, client in clients.values()),
+            return_exceptions=True
+        )
+        for (source, (_, client)), client_tools in zip(clients.items(), client_tools_list):
+            if isinstance(client_tools, BaseException):
+                if client is ums_mcp_client:
+                    raise client_tools
+                print(f"   ⚠️  Remote fetch server unavailable (this is OK): {client_tools}")
+                continue
+            for tool in client_tools:
                 tools.append(tool)
-                tool_name_client_map[tool.get('function', {}).get('name')] = fetch_mcp_client
-            print(f"   ✅ Collected {len(fetch_tools)} tools from remote fetch server")
-        except Exception as e:
-            print(f"   ⚠️  Remote fetch server unavailable (this is OK): {e}")
+                tool_name_client_map[tool.get('function', {}).get('name')] = client
+            print(f"   ✅ Collected {len(client_tools)} tools from {source}")
         
         print(f"\n→ Total tools available: {len(tools)}")
         
         # Create DIAL client
         dial_client = DialClient(
-            api_key=os.getenv("DIAL_API_KEY"),
+            api_key=DIAL_API_KEY,
             endpoint="https://ai-proxy.lab.epam.com",
             tools=tools,
             tool_name_client_map=tool_name_client_map
         )
         
         # Test query
-        messages = [
-            Message(
-                role=Role.SYSTEM,
-                content="You are an advanced AI agent. Your goal is to assist user with his questions."
-            ),
-            Message(
-                role=Role.USER,
-                content="Check if Arkadiy Dobkin present as a user, if not then search info about him in the web and add him"
-            )
-        ]
+        # Fresh list since agent appends to it, message objects themselves are never mutated
+        messages = [_SYSTEM_MSG, _USER_MSG]
         
         print("\n→ Sending query to agent:")
-        print(f"   '{messages[1].content}'")
+        print(f"   '{_USER_MSG.content}'")
         print("\n→ Agent is processing (this may take a moment)...\n")
         
         ai_message = await dial_client.get_completion(messages)
         
-        print("\n" + "-" * 100)
+        print("\n" + _DASH)
         print("AGENT RESPONSE:")
-        print("-" * 100)
+        print(_DASH)
         print(ai_message.content)
-        print("-" * 100)
+        print(_DASH)
         
         print("\n✅ Agent test PASSED")
         return True
         
     except Exception as e:
         print(f"\n❌ Agent test FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+        _TRACEBACKS.append(traceback.format_exc())
         return False
 
 
+_SSE_STREAM = (
+    ": keep-alive comment\r\n"
+    'data: {"text": "héllo — ✓ 👋"}\r\n\r\n'
+    "event: message\n"
+    'data: {"multi":\n'
+    "data: [1, 2]}\n\n"
+    "id: 3\r\n"
+    'data: {"id": 3}\n\r\n'
+    "data: [DONE]\n\n"
+    'data: {"after": "done"}\n\n'
+).encode()
+_SSE_EXPECTED = [{"text": "héllo — ✓ 👋"}, {"multi": [1, 2]}, {"id": 3}]
+
+
+async def test_sse_decoder():
+    """Test SSE decoder on fixed stream split into chunks of every size, so each boundary and
+    multibyte character gets split between chunks"""
+    print("\n" + _EQ)
+    print("OFFLINE TEST: SSE DECODER")
+    print(_EQ)
+
+    async def chunks(size: int):
+        for i in range(0, len(_SSE_STREAM), size):
+            yield _SSE_STREAM[i:i + size]
+
+    try:
+        for size in range(1, len(_SSE_STREAM) + 1):
+            response = httpx.Response(200, content=chunks(size))
+            messages = [message async for message in SSEDecoder().iter(response)]
+            assert messages == _SSE_EXPECTED, f"Chunk size {size}: unexpected messages {messages!r}"
+        print(f"   Stream decoded identically for chunk sizes 1..{len(_SSE_STREAM)}")
+
+        print("\n✅ SSE decoder test PASSED")
+        return True
+
+    except Exception as e:
+        print(f"\n❌ SSE decoder test FAILED: {e}")
+        _TRACEBACKS.append(traceback.format_exc())
+        return False
+
+
+async def _run_buffered(test) -> tuple[bool, str]:
+    """Run test with its own output buffer, gather() runs it in a separate task with copied context"""
+    buffer = io.StringIO()
+    _OUTPUT.set(buffer)
+    try:
+        result = await test()
+    except Exception as e:
+        # Output is buffered, so unhandled error is reported next to the rest of the test output
+        print(f"\n❌ Test raised unhandled error: {e!r}")
+        _TRACEBACKS.append(traceback.format_exc())
+        result = False
+    return result, buffer.getvalue()
+
+
 async def main():
     """Run all tests"""
-    print("\n" + "🎯" * 50)
+    try:
+        return await _run_tests()
+    finally:
+        _TOOLS_CACHE.clear()
+        await close_clients()
+        await close_session()
+
+
+async def _run_tests():
+    print("\n" + _EMOJI)
     print("ADVANCED MCP - COMPREHENSIVE TEST SUITE")
-    print("🎯" * 50)
+    print(_EMOJI)
     
+    # Offline tests don't need services, so they run first
+    results = [("SSE Decoder (Offline)", await test_sse_decoder())]
+
     # Check services
     if not await check_services():
         print("\n❌ Service check failed. Please start required services and try again.")
         sys.exit(1)
     
-    # Run tests
-    results = []
-    
-    # Test 1: MCPClient
-    result1 = await test_mcp_client_library()
-    results.append(("MCPClient (Library)", result1))
-    
-    # Small delay between tests
-    await asyncio.sleep(2)
-    
-    # Test 2: CustomMCPClient
-    result2 = await test_custom_mcp_client()
-    results.append(("CustomMCPClient (Pure Python)", result2))
-    
-    # Small delay between tests
-    await asyncio.sleep(2)
-    
-    # Test 3: Full Agent
-    result3 = await test_agent_with_query()
-    results.append(("Full Agent with Query", result3))
+    # Run tests concurrently, output of each test is buffered and printed after all of them finish
+    tests = (
+        ("MCPClient (Library)", test_mcp_client_library),
+        ("CustomMCPClient (Pure Python)", test_custom_mcp_client),
+        ("Full Agent with Query", test_agent_with_query),
+    )
+    stdout = sys.stdout
+    sys.stdout = _TaskStdout(stdout)
+    try:
+        outcomes = await asyncio.gather(*(_run_buffered(test) for _, test in tests), return_exceptions=True)
+    finally:
+        sys.stdout = stdout
+
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"\n❌ {test_name} test crashed: {outcome}")
+            results.append((test_name, False))
+            continue
+        result, output = outcome
+        print(output, end="")
+        results.append((test_name, result is True))
+
+    # Tests run concurrently and may fail for the same reason, so each distinct traceback is printed once
+    for tb in dict.fromkeys(_TRACEBACKS):
+        print(f"\n{tb}", end="", file=sys.stderr)
+    _TRACEBACKS.clear()
     
     # Summary
-    print("\n" + "=" * 100)
+    print("\n" + _EQ)
     print("TEST SUMMARY")
-    print("=" * 100)
-    for test_name, passed in results:
-        status = "✅ PASSED" if passed else "❌ FAILED"
-        print(f"{test_name:40s} {status}")
-    print("=" * 100)
+    print(_EQ)
+    print("\n".join(f"{test_name:40s} {'✅ PASSED' if passed else '❌ FAILED'}" for test_name, passed in results))
+    print(_EQ)
     
     all_passed = all(result for _, result in results)
     if all_passed:
@@ -305,6 +591,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        exit_code = asyncio.run(main())
+    else:
+        exit_code = uvloop.run(main())
     sys.exit(exit_code)
 